@@ -50,11 +50,12 @@ def cmd_events(args, event_store) -> None:
     )
 
     # Keep only events from result
-    events_only = {"events": result.get("events", []), "events_error": result.get("events_error")}
+    events_only = {"events": result.events, "events_error": result.events_error}
 
     # Output as JSON or Markdown (default)
     if args.json:
-        print(json.dumps(events_only, indent=2))
+        # default=dict materializes any lazy event views
+        print(json.dumps(events_only, indent=2, default=dict))
     else:
         print(format_as_markdown(events_only))
 
@@ -70,8 +71,8 @@ def cmd_reminders(args, event_store) -> None:
 
     # Keep only reminders from result
     reminders_only = {
-        "reminders": result.get("reminders", []),
-        "reminders_error": result.get("reminders_error"),
+        "reminders": result.reminders,
+        "reminders_error": result.reminders_error,
     }
 
     # Output as JSON or Markdown (default)
@@ -94,9 +95,9 @@ def cmd_all(args, event_store) -> None:
 
     # Output as JSON or Markdown (default)
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json.dumps(result._asdict(), indent=2, default=dict))
     else:
-        print(format_as_markdown(result))
+        print(format_as_markdown(result._asdict()))
 
 
 def cmd_calendars(args, event_store) -> None:
@@ -123,9 +124,9 @@ def cmd_today(args, event_store) -> None:
 
     # Output as JSON or Markdown (default)
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json.dumps(result._asdict(), indent=2, default=dict))
     else:
-        print(format_as_markdown(result))
+        print(format_as_markdown(result._asdict()))
 
 
 def cmd_schema(args, event_store) -> None:
@@ -148,14 +149,8 @@ def cmd_mcp(args, event_store, quiet=False) -> None:
     mcp.run("stdio")
 
 
-def main() -> None:
-    """Main function to get and display calendar events and reminders."""
-    # Check which command was used to invoke the script
-    import os
-
-    program_name = os.path.basename(sys.argv[0])
-    mcp_default = program_name == "calendar-app-mcp"
-
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with all subcommands."""
     # Create main parser
     parser = argparse.ArgumentParser(
         description=f"Calendar app for events and reminders (v{__version__})",
@@ -233,7 +228,19 @@ def main() -> None:
     mcp_parser = subparsers.add_parser("mcp", help="Run as an MCP server")
     mcp_parser.set_defaults(func=cmd_mcp)
 
+    return parser
+
+
+def main() -> None:
+    """Main function to get and display calendar events and reminders."""
+    # Check which command was used to invoke the script
+    import os
+
+    program_name = os.path.basename(sys.argv[0])
+    mcp_default = program_name == "calendar-app-mcp"
+
     # Parse arguments
+    parser = build_parser()
     args = parser.parse_args()
 
     # Get quiet flag for mcp
@@ -2,6 +2,7 @@
 
 import sys
 import time
+from typing import NamedTuple
 
 from EventKit import (
     EKCalendarEventAvailabilityBusy,
@@ -11,10 +12,19 @@ from EventKit import (
 )
 from Foundation import NSDate, NSDefaultRunLoopMode, NSRunLoop
 
-from calendar_app.models.formatters import format_event, format_reminder
+from calendar_app.models.formatters import LazyEvent, format_reminder
 from calendar_app.utils.date_utils import get_date_range
 
 
+class FetchResult(NamedTuple):
+    """Events and reminders fetched for a date range."""
+
+    events: list
+    reminders: list
+    events_error: str | None = None
+    reminders_error: str | None = None
+
+
 class CalendarEventStore:
     """Class to handle calendar event store operations."""
 
@@ -129,7 +139,10 @@ class CalendarEventStore:
         start_date, end_date = get_date_range(from_date, to_date)
 
         # Initialize results
-        result = {"events": [], "reminders": []}
+        event_items = []
+        reminder_items = []
+        events_error = None
+        reminders_error = None
 
         # Get calendar events
         if self.event_authorized:
@@ -156,11 +169,11 @@ class CalendarEventStore:
                     continue
                 filtered_events.append(event)
 
-            # Format events
+            # Wrap events in lazy views; fields are formatted on first access
             for event in filtered_events:
-                result["events"].append(format_event(event))
+                event_items.append(LazyEvent(event))
         else:
-            result["events_error"] = "Calendar access not authorized"
+            events_error = "Calendar access not authorized"
 
         # Get reminders
         if self.reminder_authorized:
@@ -211,8 +224,13 @@ class CalendarEventStore:
                 # Format reminders
                 if reminders_result["reminders"]:
                     for reminder in reminders_result["reminders"]:
-                        result["reminders"].append(format_reminder(reminder))
+                        reminder_items.append(format_reminder(reminder))
         else:
-            result["reminders_error"] = "Reminders access not authorized"
+            reminders_error = "Reminders access not authorized"
 
-        return result
+        return FetchResult(
+            events=event_items,
+            reminders=reminder_items,
+            events_error=events_error,
+            reminders_error=reminders_error,
+        )
@@ -1,7 +1,9 @@
 """Formatters for converting EventKit objects to dictionaries."""
 
+import functools
 import re
 import sys
+from collections.abc import Mapping
 
 from EventKit import EKCalendarEventAvailabilityBusy
 
@@ -27,136 +29,193 @@ def get_human_readable_status(status_code):
         return "unknown"
 
 
-def format_event(event):
-    """Format an EKEvent as a dictionary."""
-    # Format participants if available
-    participants = []
-    if event.hasAttendees():
-        for attendee in event.attendees():
-            participant = {
-                "name": attendee.name() if attendee.name() else "Unknown",
-                "email": attendee.emailAddress() if attendee.emailAddress() else None,
-                "status": get_human_readable_status(attendee.participantStatus()),
-                "type": {
-                    0: "unknown",  # EKParticipantTypeUnknown
-                    1: "person",  # EKParticipantTypePerson
-                    2: "room",  # EKParticipantTypeRoom
-                    3: "resource",  # EKParticipantTypeResource
-                    4: "group",  # EKParticipantTypeGroup
-                }.get(
-                    (
-                        int(attendee.participantType())
-                        if attendee.participantType() is not None
-                        else 0
-                    ),
-                    "unknown",
-                ),
-                "role": {
-                    0: "unknown",  # EKParticipantRoleUnknown
-                    1: "required",  # EKParticipantRoleRequired
-                    2: "optional",  # EKParticipantRoleOptional
-                    3: "chair",  # EKParticipantRoleChair
-                    4: "non-participant",  # EKParticipantRoleNonParticipant
-                }.get(
-                    (
-                        int(attendee.participantRole())
-                        if attendee.participantRole() is not None
-                        else 0
-                    ),
-                    "unknown",
-                ),
-                "is_organizer": (bool(event.organizer() and attendee.isEqual_(event.organizer()))),
-            }
-            participants.append(participant)
-
-    # Check for conference URL in notes or URL
-    conference_url = None
-    notes = event.notes()
-    url_obj = event.URL()
-
-    # Safe string conversion for URL
-    url_str = None
-    if url_obj is not None:
+class LazyEvent(Mapping):
+    """Lazy, dict-like view of an EKEvent.
+
+    Fields are extracted from the underlying EventKit object on first access
+    and cached, so callers that only read a few fields (e.g. search filtering)
+    never pay for the expensive ones like participants or conference URLs.
+    """
+
+    _FIELDS = (
+        "title",
+        "location",
+        "notes",
+        "start_time",
+        "end_time",
+        "all_day",
+        "calendar",
+        "url",
+        "availability",
+        "conference_url",
+        "participants",
+        "has_organizer",
+        "organizer",
+    )
+
+    __slots__ = ("_cache", "_event")
+
+    def __init__(self, event) -> None:
+        self._event = event
+        self._cache = {}
+
+    def __getitem__(self, key):
+        if key in self._cache:
+            return self._cache[key]
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        value = getattr(self, f"_extract_{key}")()
+        self._cache[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._FIELDS)
+
+    def _extract_title(self):
+        return self._event.title()
+
+    def _extract_location(self):
+        # Get the location, or use conference URL if location is empty
+        location = self._event.location()
+        if not location and self["conference_url"]:
+            location = self["conference_url"]
+        return location
+
+    def _extract_notes(self):
+        return self._event.notes() if self._event.notes() else None
+
+    def _extract_start_time(self):
+        return self._event.startDate().description() if self._event.startDate() else None
+
+    def _extract_end_time(self):
+        return self._event.endDate().description() if self._event.endDate() else None
+
+    def _extract_all_day(self):
+        return self._event.isAllDay()
+
+    def _extract_calendar(self):
+        return self._event.calendar().title()
+
+    def _extract_url(self):
+        url_obj = self._event.URL()
+        if url_obj is None:
+            return None
+
+        # Safe string conversion for URL
         try:
             # Handle string URLs
             if isinstance(url_obj, str):
-                url_str = url_obj
+                return url_obj
             # Handle NSURLs and other URL objects
             elif hasattr(url_obj, "absoluteString"):
-                url_str = url_obj.absoluteString()
+                return url_obj.absoluteString()
             # Handle tuples or lists
             elif isinstance(url_obj, tuple | list) and len(url_obj) > 0:
                 # Try to get the first element if it's a tuple/list
                 first_element = url_obj[0]
                 if hasattr(first_element, "absoluteString"):
-                    url_str = first_element.absoluteString()
+                    return first_element.absoluteString()
                 else:
-                    url_str = str(first_element)
+                    return str(first_element)
             # Fallback
             else:
-                url_str = str(url_obj)
+                return str(url_obj)
         except Exception as e:
             print(f"Error converting URL: {e}", file=sys.stderr)
-            url_str = None
-
-    # First check if the main URL is a conference URL
-    if url_str and any(
-        domain in url_str.lower()
-        for domain in ["zoom.us", "meet.google", "teams.microsoft", "webex", "bluejeans"]
-    ):
-        conference_url = url_str
-    # Then check notes for URLs if no conference URL found
-    elif notes:
-        # Look for common video conferencing URLs in notes
-        zoom_pattern = r'https?://[a-zA-Z0-9.-]+\.zoom\.us/[^\s<>"]+'
-        meet_pattern = r'https?://meet\.google\.com/[^\s<>"]+'
-        teams_pattern = r'https?://teams\.microsoft\.com/[^\s<>"]+'
-        webex_pattern = r'https?://[a-zA-Z0-9.-]+\.webex\.com/[^\s<>"]+'
-
-        # Check for each pattern
-        for pattern in [zoom_pattern, meet_pattern, teams_pattern, webex_pattern]:
-            match = re.search(pattern, notes)
-            if match:
-                conference_url = match.group(0)
-                break
-
-    # Get the location, or use conference URL if location is empty
-    location = event.location()
-    if not location and conference_url:
-        location = conference_url
+            return None
 
-    return {
-        "title": event.title(),
-        "location": location,
-        "notes": event.notes() if event.notes() else None,
-        "start_time": event.startDate().description() if event.startDate() else None,
-        "end_time": event.endDate().description() if event.endDate() else None,
-        "all_day": event.isAllDay(),
-        "calendar": event.calendar().title(),
-        "url": url_str,
-        "availability": (
-            "busy" if event.availability() == EKCalendarEventAvailabilityBusy else "free"
-        ),
-        "conference_url": conference_url,
-        "participants": participants,
-        "has_organizer": event.organizer() is not None,
-        "organizer": (
-            {
-                "name": (
-                    event.organizer().name()
-                    if event.organizer() and event.organizer().name()
-                    else None
-                ),
-                "email": (
-                    event.organizer().emailAddress()
-                    if event.organizer() and event.organizer().emailAddress()
-                    else None
-                ),
-            }
-            if event.organizer()
-            else None
-        ),
-    }
+    def _extract_availability(self):
+        return "busy" if self._event.availability() == EKCalendarEventAvailabilityBusy else "free"
+
+    def _extract_conference_url(self):
+        # First check if the main URL is a conference URL
+        url_str = self["url"]
+        if url_str and any(
+            domain in url_str.lower()
+            for domain in ["zoom.us", "meet.google", "teams.microsoft", "webex", "bluejeans"]
+        ):
+            return url_str
+
+        # Then check notes for URLs if no conference URL found
+        notes = self._event.notes()
+        if notes:
+            # Look for common video conferencing URLs in notes
+            zoom_pattern = r'https?://[a-zA-Z0-9.-]+\.zoom\.us/[^\s<>"]+'
+            meet_pattern = r'https?://meet\.google\.com/[^\s<>"]+'
+            teams_pattern = r'https?://teams\.microsoft\.com/[^\s<>"]+'
+            webex_pattern = r'https?://[a-zA-Z0-9.-]+\.webex\.com/[^\s<>"]+'
+
+            # Check for each pattern
+            for pattern in [zoom_pattern, meet_pattern, teams_pattern, webex_pattern]:
+                match = re.search(pattern, notes)
+                if match:
+                    return match.group(0)
+
+        return None
+
+    def _extract_participants(self):
+        event = self._event
+        participants = []
+        if event.hasAttendees():
+            for attendee in event.attendees():
+                participant = {
+                    "name": attendee.name() if attendee.name() else "Unknown",
+                    "email": attendee.emailAddress() if attendee.emailAddress() else None,
+                    "status": get_human_readable_status(attendee.participantStatus()),
+                    "type": {
+                        0: "unknown",  # EKParticipantTypeUnknown
+                        1: "person",  # EKParticipantTypePerson
+                        2: "room",  # EKParticipantTypeRoom
+                        3: "resource",  # EKParticipantTypeResource
+                        4: "group",  # EKParticipantTypeGroup
+                    }.get(
+                        (
+                            int(attendee.participantType())
+                            if attendee.participantType() is not None
+                            else 0
+                        ),
+                        "unknown",
+                    ),
+                    "role": {
+                        0: "unknown",  # EKParticipantRoleUnknown
+                        1: "required",  # EKParticipantRoleRequired
+                        2: "optional",  # EKParticipantRoleOptional
+                        3: "chair",  # EKParticipantRoleChair
+                        4: "non-participant",  # EKParticipantRoleNonParticipant
+                    }.get(
+                        (
+                            int(attendee.participantRole())
+                            if attendee.participantRole() is not None
+                            else 0
+                        ),
+                        "unknown",
+                    ),
+                    "is_organizer": (
+                        bool(event.organizer() and attendee.isEqual_(event.organizer()))
+                    ),
+                }
+                participants.append(participant)
+        return participants
+
+    def _extract_has_organizer(self):
+        return self._event.organizer() is not None
+
+    def _extract_organizer(self):
+        organizer = self._event.organizer()
+        if not organizer:
+            return None
+        return {
+            "name": organizer.name() if organizer.name() else None,
+            "email": organizer.emailAddress() if organizer.emailAddress() else None,
+        }
+
+
+def format_event(event):
+    """Format an EKEvent as a dictionary."""
+    return dict(LazyEvent(event))
 
 
 def format_reminder(reminder):
@@ -175,8 +234,9 @@ def format_reminder(reminder):
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_json_schema():
-    """Return the JSON schema for the output."""
+    """Return the JSON schema for the output (built once; the schema is static)."""
     return {
         "type": "object",
         "properties": {
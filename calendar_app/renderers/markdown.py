@@ -1,11 +1,18 @@
 """Markdown template renderers for calendar events and reminders."""
 
 import datetime
+import functools
 import sys
 
 from jinja2 import BaseLoader, Environment, StrictUndefined
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_dt(date_str):
+    """Parse an event timestamp; a day's rendering repeats the same strings."""
+    return datetime.datetime.fromisoformat(date_str.replace(" +0000", "+00:00"))
+
+
 def format_as_markdown(result):
     """Format the events and reminders result dictionary as Markdown."""
     # Create a renderer and generate the markdown
@@ -111,8 +118,7 @@ No events or reminders found for the specified criteria.
         if not date_str:
             return ""
         try:
-            dt = datetime.datetime.fromisoformat(date_str.replace(" +0000", "+00:00"))
-            return dt.strftime("%Y-%m-%d")
+            return _parse_dt(date_str).strftime("%Y-%m-%d")
         except (ValueError, AttributeError):
             return date_str
 
@@ -123,16 +129,8 @@ No events or reminders found for the specified criteria.
 
         try:
             # Parse the ISO format dates
-            start_dt = (
-                datetime.datetime.fromisoformat(start_time_str.replace(" +0000", "+00:00"))
-                if start_time_str
-                else None
-            )
-            end_dt = (
-                datetime.datetime.fromisoformat(end_time_str.replace(" +0000", "+00:00"))
-                if end_time_str
-                else None
-            )
+            start_dt = _parse_dt(start_time_str) if start_time_str else None
+            end_dt = _parse_dt(end_time_str) if end_time_str else None
 
             # Format times
             start_fmt = start_dt.strftime("%H:%M") if start_dt else ""
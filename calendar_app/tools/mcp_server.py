@@ -1,6 +1,10 @@
 """MCP server for calendar events and reminders."""
 
 import datetime
+import functools
+import hashlib
+import json
+import time
 
 import fastmcp
 
@@ -13,11 +17,30 @@ from calendar_app.utils.date_utils import (
     list_common_timezones,
 )
 
+# How long cached calendar/timezone listings stay fresh, in seconds
+_LISTING_TTL = 60
+
+
+def _etag(data):
+    """Compute a short content hash usable as an ETag for a JSON payload."""
+    payload = json.dumps(data, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
 
 def setup_mcp_server(event_store):
     """Set up the MCP server for calendar events and reminders."""
     mcp = fastmcp.FastMCP("Calendar Events")
 
+    # Calendar and timezone listings change rarely but are requested often;
+    # cache them per TTL bucket so repeated calls skip the underlying work
+    @functools.lru_cache(maxsize=1)
+    def _cached_calendars(epoch_bucket):
+        return event_store.get_calendars()
+
+    @functools.lru_cache(maxsize=1)
+    def _cached_timezones(epoch_bucket):
+        return list_common_timezones()
+
     @mcp.tool()
     def get_events(
         ctx: fastmcp.Context,
@@ -66,18 +89,18 @@ def setup_mcp_server(event_store):
         )
 
         events_only_result = {
-            "events": result.get("events", []),
-            "events_error": result.get("events_error"),
+            "events": result.events,
+            "events_error": result.events_error,
         }
 
-        events_count = len(events_only_result.get("events", []))
-        ctx.info(f"Found {events_count} events")
+        ctx.info(f"Found {len(result.events)} events")
 
-        if events_only_result.get("events_error"):
-            ctx.warning(f"Error retrieving events: {events_only_result.get('events_error')}")
+        if result.events_error:
+            ctx.warning(f"Error retrieving events: {result.events_error}")
 
         if format_json:
-            return events_only_result.get("events", [])  # Return only the events list for json
+            # Materialize lazy views and return only the events list for json
+            return [dict(event) for event in result.events]
         else:
             return format_as_markdown(events_only_result)  # Default to markdown
 
@@ -124,22 +147,17 @@ def setup_mcp_server(event_store):
         )
 
         reminders_only_result = {
-            "reminders": result.get("reminders", []),
-            "reminders_error": result.get("reminders_error"),
+            "reminders": result.reminders,
+            "reminders_error": result.reminders_error,
         }
 
-        reminders_count = len(reminders_only_result.get("reminders", []))
-        ctx.info(f"Found {reminders_count} reminders")
+        ctx.info(f"Found {len(result.reminders)} reminders")
 
-        if reminders_only_result.get("reminders_error"):
-            ctx.warning(
-                f"Error retrieving reminders: {reminders_only_result.get('reminders_error')}"
-            )
+        if result.reminders_error:
+            ctx.warning(f"Error retrieving reminders: {result.reminders_error}")
 
         if format_json:
-            return reminders_only_result.get(
-                "reminders", []
-            )  # Return only the reminders list for json
+            return result.reminders  # Return only the reminders list for json
         else:
             return format_as_markdown(reminders_only_result)  # Default to markdown
 
@@ -157,7 +175,7 @@ def setup_mcp_server(event_store):
         """
         ctx.info("Fetching list of all available calendars")
 
-        calendars_data = event_store.get_calendars()
+        calendars_data = _cached_calendars(int(time.time() // _LISTING_TTL))
 
         event_calendar_count = len(calendars_data.get("event_calendars", []))
         reminder_calendar_count = len(calendars_data.get("reminder_calendars", []))
@@ -166,7 +184,7 @@ def setup_mcp_server(event_store):
         )
 
         if format_json:
-            return calendars_data
+            return {**calendars_data, "etag": _etag(calendars_data)}
         else:
             renderer = CalendarListTemplateRenderer(calendars_data)
             return renderer.generate()
@@ -187,19 +205,21 @@ def setup_mcp_server(event_store):
 
         result = event_store.get_events_and_reminders()  # Gets today by default
 
-        events_count = len(result.get("events", []))
-        reminders_count = len(result.get("reminders", []))
-        ctx.info(f"Found {events_count} events and {reminders_count} reminders for today")
+        ctx.info(
+            f"Found {len(result.events)} events and {len(result.reminders)} reminders for today"
+        )
 
-        if result.get("events_error"):
-            ctx.warning(f"Error retrieving events: {result.get('events_error')}")
-        if result.get("reminders_error"):
-            ctx.warning(f"Error retrieving reminders: {result.get('reminders_error')}")
+        if result.events_error:
+            ctx.warning(f"Error retrieving events: {result.events_error}")
+        if result.reminders_error:
+            ctx.warning(f"Error retrieving reminders: {result.reminders_error}")
 
         if format_json:
-            return result
+            data = result._asdict()
+            data["events"] = [dict(event) for event in result.events]
+            return data
         else:
-            return format_as_markdown(result)
+            return format_as_markdown(result._asdict())
 
     @mcp.tool()
     def search(
@@ -244,58 +264,53 @@ def setup_mcp_server(event_store):
 
         # Filter results based on search term (case-insensitive)
         search_term_lower = search_term.lower()
-        filtered_events = []
-        if "events" in all_results:
-            ctx.report_progress(0, 2)  # Start progress (0/2 parts complete)
-            events_count = len(all_results["events"])
-            ctx.info(f"Searching through {events_count} events")
-
-            for event in all_results["events"]:
-                title = (event.get("title") or "").lower()
-                notes = (event.get("notes") or "").lower()
-                location = (event.get("location") or "").lower()
-                if (
-                    search_term_lower in title
-                    or search_term_lower in notes
-                    or search_term_lower in location
-                ):
-                    filtered_events.append(event)
-
-            ctx.report_progress(1, 2)  # Update progress (1/2 parts complete)
-
-        filtered_reminders = []
-        if "reminders" in all_results:
-            reminders_count = len(all_results["reminders"])
-            ctx.info(f"Searching through {reminders_count} reminders")
-
-            for reminder in all_results["reminders"]:
-                title = (reminder.get("title") or "").lower()
-                notes = (reminder.get("notes") or "").lower()
-                if search_term_lower in title or search_term_lower in notes:
-                    filtered_reminders.append(reminder)
-
-            ctx.report_progress(2, 2)  # Complete progress (2/2 parts complete)
+        ctx.report_progress(0, 2)  # Start progress (0/2 parts complete)
+        ctx.info(f"Searching through {len(all_results.events)} events")
+
+        filtered_events = [
+            event
+            for event in all_results.events
+            if search_term_lower in (event.get("title") or "").lower()
+            or search_term_lower in (event.get("notes") or "").lower()
+            or search_term_lower in (event.get("location") or "").lower()
+        ]
+
+        ctx.report_progress(1, 2)  # Update progress (1/2 parts complete)
+
+        ctx.info(f"Searching through {len(all_results.reminders)} reminders")
+
+        filtered_reminders = [
+            reminder
+            for reminder in all_results.reminders
+            if search_term_lower in (reminder.get("title") or "").lower()
+            or search_term_lower in (reminder.get("notes") or "").lower()
+        ]
+
+        ctx.report_progress(2, 2)  # Complete progress (2/2 parts complete)
 
         # Prepare the final result structure, including potential errors
         final_result = {
             "events": filtered_events,
             "reminders": filtered_reminders,
-            "events_error": all_results.get("events_error"),
-            "reminders_error": all_results.get("reminders_error"),
+            "events_error": all_results.events_error,
+            "reminders_error": all_results.reminders_error,
         }
 
         ctx.info(
             f"Found {len(filtered_events)} matching events and {len(filtered_reminders)} matching reminders"
         )
 
-        if all_results.get("events_error"):
-            ctx.warning(f"Error retrieving events: {all_results.get('events_error')}")
-        if all_results.get("reminders_error"):
-            ctx.warning(f"Error retrieving reminders: {all_results.get('reminders_error')}")
+        if all_results.events_error:
+            ctx.warning(f"Error retrieving events: {all_results.events_error}")
+        if all_results.reminders_error:
+            ctx.warning(f"Error retrieving reminders: {all_results.reminders_error}")
 
         if format_json:
-            # Return only the filtered lists for JSON output
-            return {"events": filtered_events, "reminders": filtered_reminders}
+            # Return only the filtered lists for JSON output, materializing lazy views
+            return {
+                "events": [dict(event) for event in filtered_events],
+                "reminders": filtered_reminders,
+            }
         else:
             # Reuse the existing markdown renderer
             return format_as_markdown(final_result)
@@ -320,19 +335,19 @@ def setup_mcp_server(event_store):
         ctx.info(f"Fetching events and reminders for {date_str}")
         result = event_store.get_events_and_reminders(from_date=date_obj, to_date=date_obj)
 
-        events_count = len(result.get("events", []))
-        reminders_count = len(result.get("reminders", []))
-        ctx.info(f"Found {events_count} events and {reminders_count} reminders for {date_str}")
+        ctx.info(
+            f"Found {len(result.events)} events and {len(result.reminders)} reminders for {date_str}"
+        )
 
         events_str = ""
-        for event in result.get("events", []):
+        for event in result.events:
             start_time = event.get("start_time", "All day")
             end_time = event.get("end_time", "")
             time_str = f"{start_time} - {end_time}" if end_time else start_time
             events_str += f"- {event['title']} ({time_str})\n"
 
         reminders_str = ""
-        for reminder in result.get("reminders", []):
+        for reminder in result.reminders:
             due_date = reminder.get("due_date", "No due date")
             status = "Completed" if reminder.get("completed", False) else "Incomplete"
             reminders_str += f"- {reminder['title']} ({due_date}, {status})\n"
@@ -433,7 +448,7 @@ What should I focus on today? Any conflicts or tight schedules to be aware of?
         """
         ctx.info("Listing available timezones")
 
-        result = list_common_timezones()
+        result = _cached_timezones(int(time.time() // _LISTING_TTL))
 
         if region:
             ctx.info(f"Filtering timezones by region: {region}")
@@ -454,6 +469,6 @@ What should I focus on today? Any conflicts or tight schedules to be aware of?
         else:
             ctx.info(f"Found {result['total_count']} timezones in {len(result['regions'])} regions")
 
-        return result
+        return {**result, "etag": _etag(result)}
 
     return mcp
@@ -1,21 +1,117 @@
 """Date utility functions for calendar app."""
 
 import argparse
+import dataclasses
 import datetime
+import functools
+import time
 import pytz
 import zoneinfo
 from typing import Any, Dict, Optional
 
 from Foundation import NSDate
 
+__all__ = [
+    "convert_timezone",
+    "convert_timezone_many",
+    "get_current_datetime",
+    "get_date_range",
+    "list_common_timezones",
+    "parse_date",
+]
+
+
+# strptime re-runs its format machinery per call; for these ISO shapes
+# the C-implemented fromisoformat is far cheaper
+_ISO_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S")
+
+_INVALID_DATE_MSG = "Invalid date format: {}. Use YYYY-MM-DD."
+
 
 def parse_date(date_str):
     """Parse a date string in YYYY-MM-DD format."""
     try:
-        return datetime.datetime.strptime(date_str, "%Y-%m-%d")
+        # fromisoformat also accepts compact (20230115) and week (2023-W02-1)
+        # dates, so pin the YYYY-MM-DD shape before taking the fast path
+        if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+            raise ValueError(date_str)
+        day = datetime.date.fromisoformat(date_str)
+        return datetime.datetime(day.year, day.month, day.day)
     except ValueError:
-        msg = f"Invalid date format: {date_str}. Use YYYY-MM-DD."
-        raise argparse.ArgumentTypeError(msg)
+        raise argparse.ArgumentTypeError(_INVALID_DATE_MSG.format(date_str))
+
+
+def _parse_dt(dt_str: str, dt_format: str) -> datetime.datetime:
+    """Parse a datetime string, taking the fromisoformat fast path for ISO formats."""
+    # fromisoformat accepts strictly more than the strptime formats it
+    # replaces (week dates, the other separator), so pin the input to the
+    # literal YYYY-MM-DD<sep>HH:MM:SS shape of dt_format - the separator
+    # sits at index 8 of both format strings - before trusting it; with
+    # the shape pinned there is no room left for offsets or fractions
+    if (
+        dt_format in _ISO_FORMATS
+        and len(dt_str) == 19
+        and dt_str[4] == "-"
+        and dt_str[7] == "-"
+        and dt_str[10] == dt_format[8]
+        and dt_str[13] == ":"
+        and dt_str[16] == ":"
+    ):
+        try:
+            return datetime.datetime.fromisoformat(dt_str.replace(" ", "T"))
+        except ValueError:
+            # Fall through so the caller's error message names dt_format
+            pass
+    return datetime.datetime.strptime(dt_str, dt_format)
+
+
+_WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+@functools.cache
+def _fmt_offset_secs(total: int) -> str:
+    """Format a UTC offset in whole seconds as +HHMM without strftime.
+
+    The world has only a few dozen distinct offsets, so formatting each
+    one once covers every zone in the listing.
+    """
+    sign = "+" if total >= 0 else "-"
+    total = abs(total)
+    return f"{sign}{total // 3600:02d}{total % 3600 // 60:02d}"
+
+
+def _fmt_offset(offset: datetime.timedelta) -> str:
+    """Format a UTC offset as +HHMM without the strftime machinery."""
+    return _fmt_offset_secs(int(offset.total_seconds()))
+
+
+@functools.cache
+def _get_tz(name: str) -> zoneinfo.ZoneInfo:
+    """Cached zoneinfo lookup; raises for unknown timezone names.
+
+    zoneinfo objects attach to datetimes natively, with none of pytz's
+    localize/normalize overhead; pytz remains only to enumerate
+    common_timezones.
+    """
+    return zoneinfo.ZoneInfo(name)
+
+
+_END_OF_DAY = datetime.time(23, 59, 59)
+
+
+@functools.lru_cache(maxsize=256)
+def _ns_bounds(from_iso, to_iso):
+    """Convert an inclusive YYYY-MM-DD range to a cached (start, end) NSDate pair."""
+    from_day = datetime.date.fromisoformat(from_iso)
+    to_day = datetime.date.fromisoformat(to_iso)
+
+    # combine is a single C call, cheaper than the validating constructor
+    start = datetime.datetime.combine(from_day, datetime.time.min)
+    end = datetime.datetime.combine(to_day, _END_OF_DAY)
+
+    # Convert to NSDate through one bound-method lookup
+    ns_from_ts = NSDate.dateWithTimeIntervalSince1970_
+    return ns_from_ts(start.timestamp()), ns_from_ts(end.timestamp())
 
 
 def get_date_range(from_date, to_date):
@@ -23,73 +119,146 @@ def get_date_range(from_date, to_date):
     # If no dates provided, use today
     if not from_date:
         from_date = datetime.datetime.now()
-        from_date = datetime.datetime(from_date.year, from_date.month, from_date.day, 0, 0, 0)
-    else:
-        from_date = datetime.datetime(from_date.year, from_date.month, from_date.day, 0, 0, 0)
-
     if not to_date:
         to_date = from_date
-        to_date = datetime.datetime(to_date.year, to_date.month, to_date.day, 23, 59, 59)
-    else:
-        to_date = datetime.datetime(to_date.year, to_date.month, to_date.day, 23, 59, 59)
 
-    # Convert to NSDate
-    start_date = NSDate.dateWithTimeIntervalSince1970_(from_date.timestamp())
-    end_date = NSDate.dateWithTimeIntervalSince1970_(to_date.timestamp())
+    # Repeated queries for the same range reuse the cached NSDate pair,
+    # skipping redundant Objective-C bridge round-trips
+    return _ns_bounds(from_date.date().isoformat(), to_date.date().isoformat())
 
-    return start_date, end_date
 
+# Consecutive calls within the same wall-clock second reuse one result;
+# callers treat the returned dict as read-only
+_now_cache: dict[tuple[str | None, int], dict[str, Any]] = {}
 
-def get_current_datetime(timezone: str | None = None) -> dict[str, Any]:
+
+def get_current_datetime(
+    timezone: str | None = None, now: datetime.datetime | None = None
+) -> dict[str, Any]:
     """
     Get the current date and time, optionally in a specific timezone.
 
     Args:
         timezone: Optional timezone name (e.g., 'America/New_York', 'Europe/London')
                  If not provided, uses the system's local timezone.
+        now: Optional pre-captured UTC time, so callers handling a single
+             request can share one clock reading across helpers.
 
     Returns:
         A dictionary containing date and time information
     """
-    # Get current time in UTC
-    now_utc = datetime.datetime.now(datetime.timezone.utc)
+    if now is not None:
+        # The caller controls the clock; bypass the per-second cache
+        return _build_current_datetime(timezone, now)
+
+    key = (timezone, int(time.time()))
+    cached = _now_cache.get(key)
+    if cached is None:
+        if len(_now_cache) > 4:
+            # The second rolled over; drop stale entries
+            _now_cache.clear()
+        cached = _now_cache[key] = _build_current_datetime(
+            timezone, datetime.datetime.now(datetime.timezone.utc)
+        )
+    return cached
+
+
+class _ResultBlock:
+    """Dict-style access shim so callers keep using result["field"] syntax."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return isinstance(key, str) and hasattr(self, key)
+
+    def keys(self):
+        return tuple(field.name for field in dataclasses.fields(self))
+
+
+# Slotted blocks allocate in one step with no per-key hashing, which adds
+# up when these results are produced in a tight server loop
+@dataclasses.dataclass(frozen=True, slots=True)
+class _DateInfo(_ResultBlock):
+    year: int
+    month: int
+    day: int
+    weekday: str
+    iso_date: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _TimeInfo(_ResultBlock):
+    hour: int
+    minute: int
+    second: int
+    iso_time: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _TimezoneInfo(_ResultBlock):
+    name: str
+    utc_offset: str
+    utc_offset_hours: float
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _OriginalDatetime(_ResultBlock):
+    datetime: str
+    timezone: str
+    iso_datetime: str
+
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class _ConvertedDatetime(_ResultBlock):
+    datetime: str
+    timezone: str
+    iso_datetime: str
+    date: str
+    time: str
+
+
+def _build_current_datetime(timezone: str | None, now_utc: datetime.datetime) -> dict[str, Any]:
+    """Build the get_current_datetime result for one clock reading."""
     # Get local timezone if none provided
     if timezone is None:
         local_tz = datetime.datetime.now().astimezone().tzinfo
         now_local = now_utc.astimezone(local_tz)
         timezone_name = str(local_tz)
     else:
-        try:
-            tz = zoneinfo.ZoneInfo(timezone)
-            now_local = now_utc.astimezone(tz)
-            timezone_name = timezone
-        except Exception as e:
+        if timezone not in _ALL_TZ:
             return {
-                "error": f"Invalid timezone: {timezone}. Error: {str(e)}",
+                "error": f"Invalid timezone: {timezone}",
                 "valid_format": "Use IANA timezone names like 'America/New_York' or 'Europe/London'",
             }
+        now_local = now_utc.astimezone(_get_tz(timezone))
+        timezone_name = timezone
 
     # Format results
     return {
-        "date": {
-            "year": now_local.year,
-            "month": now_local.month,
-            "day": now_local.day,
-            "weekday": now_local.strftime("%A"),
-            "iso_date": now_local.date().isoformat(),
-        },
-        "time": {
-            "hour": now_local.hour,
-            "minute": now_local.minute,
-            "second": now_local.second,
-            "iso_time": now_local.time().isoformat(timespec="seconds"),
-        },
-        "timezone": {
-            "name": timezone_name,
-            "utc_offset": now_local.strftime("%z"),
-            "utc_offset_hours": float(now_local.utcoffset().total_seconds() / 3600),
-        },
+        "date": _DateInfo(
+            year=now_local.year,
+            month=now_local.month,
+            day=now_local.day,
+            weekday=_WEEKDAY_NAMES[now_local.weekday()],
+            iso_date=now_local.date().isoformat(),
+        ),
+        "time": _TimeInfo(
+            hour=now_local.hour,
+            minute=now_local.minute,
+            second=now_local.second,
+            iso_time=now_local.time().isoformat(timespec="seconds"),
+        ),
+        "timezone": _TimezoneInfo(
+            name=timezone_name,
+            utc_offset=_fmt_offset(now_local.utcoffset()),
+            utc_offset_hours=float(now_local.utcoffset().total_seconds() / 3600),
+        ),
         "iso_datetime": now_local.isoformat(timespec="seconds"),
         "unix_timestamp": int(now_utc.timestamp()),
     }
@@ -112,46 +281,64 @@ def convert_timezone(
     """
     try:
         # Parse the input datetime string
-        dt = datetime.datetime.strptime(dt_str, dt_format)
+        dt = _parse_dt(dt_str, dt_format)
 
         # Make it timezone-aware with the source timezone
-        try:
-            source_tz = zoneinfo.ZoneInfo(from_timezone)
-        except Exception as e:
+        if from_timezone not in _ALL_TZ:
             return {
-                "error": f"Invalid source timezone: {from_timezone}. Error: {str(e)}",
+                "error": f"Invalid source timezone: {from_timezone}",
                 "valid_format": "Use IANA timezone names like 'America/New_York' or 'Europe/London'",
             }
 
-        source_dt = dt.replace(tzinfo=source_tz)
+        source_dt = dt.replace(tzinfo=_get_tz(from_timezone))
+
+        # Identity conversions need no arithmetic: skip the target lookup,
+        # astimezone, and re-formatting entirely
+        if from_timezone == to_timezone:
+            iso_datetime = source_dt.isoformat()
+            return {
+                "original": _OriginalDatetime(
+                    datetime=dt_str,
+                    timezone=from_timezone,
+                    iso_datetime=iso_datetime,
+                ),
+                "converted": _ConvertedDatetime(
+                    datetime=dt_str,
+                    timezone=to_timezone,
+                    iso_datetime=iso_datetime,
+                    date=source_dt.date().isoformat(),
+                    time=source_dt.time().isoformat(timespec="seconds"),
+                ),
+                "offset_hours": 0.0,
+            }
 
         # Convert to the target timezone
-        try:
-            target_tz = zoneinfo.ZoneInfo(to_timezone)
-        except Exception as e:
+        if to_timezone not in _ALL_TZ:
             return {
-                "error": f"Invalid target timezone: {to_timezone}. Error: {str(e)}",
+                "error": f"Invalid target timezone: {to_timezone}",
                 "valid_format": "Use IANA timezone names like 'America/New_York' or 'Europe/London'",
             }
 
-        target_dt = source_dt.astimezone(target_tz)
+        target_dt = source_dt.astimezone(_get_tz(to_timezone))
+
+        # Capture both offsets once rather than re-deriving them per field
+        offset_delta = target_dt.utcoffset() - source_dt.utcoffset()
 
         # Return formatted result
         return {
-            "original": {
-                "datetime": dt_str,
-                "timezone": from_timezone,
-                "iso_datetime": source_dt.isoformat(),
-            },
-            "converted": {
-                "datetime": target_dt.strftime(dt_format),
-                "timezone": to_timezone,
-                "iso_datetime": target_dt.isoformat(),
-                "date": target_dt.date().isoformat(),
-                "time": target_dt.time().isoformat(timespec="seconds"),
-            },
-            "offset_hours": float(target_dt.utcoffset().total_seconds() / 3600)
-            - float(source_dt.utcoffset().total_seconds() / 3600),
+            "original": _OriginalDatetime(
+                datetime=dt_str,
+                timezone=from_timezone,
+                iso_datetime=source_dt.isoformat(),
+            ),
+            "converted": _ConvertedDatetime(
+                datetime=target_dt.strftime(dt_format),
+                timezone=to_timezone,
+                iso_datetime=target_dt.isoformat(),
+                date=target_dt.date().isoformat(),
+                time=target_dt.time().isoformat(timespec="seconds"),
+            ),
+            "offset_hours": offset_delta.total_seconds() / 3600,
         }
     except ValueError as e:
         return {
@@ -160,37 +347,166 @@ def convert_timezone(
         }
 
 
-def list_common_timezones() -> Dict[str, Any]:
+def convert_timezone_many(
+    dt_strs, from_timezone: str, to_timezone: str, dt_format: str = "%Y-%m-%d %H:%M:%S"
+) -> Any:
     """
-    Get a list of common timezones grouped by region.
+    Convert several datetime strings between the same pair of timezones.
+
+    The timezones are validated and resolved once for the whole batch, so
+    per-item work is just parse, convert, and format.
+
+    Args:
+        dt_strs: Iterable of datetime strings to convert
+        from_timezone: Source timezone (IANA format, e.g., 'America/New_York')
+        to_timezone: Target timezone (IANA format, e.g., 'Europe/London')
+        dt_format: Format of the input datetime strings (default: "%Y-%m-%d %H:%M:%S")
 
     Returns:
-        A dictionary with timezone information grouped by region
+        A list with one convert_timezone-shaped dict per input string, or a
+        single error dict when either timezone is invalid.
     """
-    timezones_by_region = {}
+    if from_timezone not in _ALL_TZ:
+        return {
+            "error": f"Invalid source timezone: {from_timezone}",
+            "valid_format": "Use IANA timezone names like 'America/New_York' or 'Europe/London'",
+        }
+    if to_timezone not in _ALL_TZ:
+        return {
+            "error": f"Invalid target timezone: {to_timezone}",
+            "valid_format": "Use IANA timezone names like 'America/New_York' or 'Europe/London'",
+        }
+
+    source_tz = _get_tz(from_timezone)
+    target_tz = _get_tz(to_timezone)
+    same_zone = from_timezone == to_timezone
+
+    results = []
+    for dt_str in dt_strs:
+        try:
+            dt = _parse_dt(dt_str, dt_format)
+        except ValueError as e:
+            results.append(
+                {
+                    "error": f"Invalid datetime format: {e}",
+                    "valid_format": f"Use format: {dt_format}",
+                }
+            )
+            continue
+
+        source_dt = dt.replace(tzinfo=source_tz)
+        if same_zone:
+            target_dt = source_dt
+            offset_hours = 0.0
+        else:
+            target_dt = source_dt.astimezone(target_tz)
+            offset_hours = (target_dt.utcoffset() - source_dt.utcoffset()).total_seconds() / 3600
+
+        results.append(
+            {
+                "original": _OriginalDatetime(
+                    datetime=dt_str,
+                    timezone=from_timezone,
+                    iso_datetime=source_dt.isoformat(),
+                ),
+                "converted": _ConvertedDatetime(
+                    datetime=dt_str if same_zone else target_dt.strftime(dt_format),
+                    timezone=to_timezone,
+                    iso_datetime=target_dt.isoformat(),
+                    date=target_dt.date().isoformat(),
+                    time=target_dt.time().isoformat(timespec="seconds"),
+                ),
+                "offset_hours": offset_hours,
+            }
+        )
+    return results
 
+
+def _build_region_index() -> dict[str, tuple[str, ...]]:
+    """Group common timezone names by region; the grouping is process-static."""
+    index: dict[str, list[str]] = {}
     for tz_name in sorted(pytz.common_timezones):
-        region = tz_name.split("/", 1)[0] if "/" in tz_name else "Other"
+        # partition avoids allocating the tail list that split would build
+        head, sep, _ = tz_name.partition("/")
+        index.setdefault(head if sep else "Other", []).append(tz_name)
+    return {region: tuple(names) for region, names in index.items()}
+
+
+# O(1) name validation up front keeps bad names out of _get_tz and avoids
+# exception-driven control flow on invalid input
+_ALL_TZ = frozenset(pytz.all_timezones)
 
-        if region not in timezones_by_region:
-            timezones_by_region[region] = []
+# The region grouping and total count never change within a process, so
+# they are computed once at import
+_REGION_INDEX = _build_region_index()
+_REGIONS = sorted(_REGION_INDEX)
+_TOTAL_COUNT = len(pytz.common_timezones)
 
-        # Get current time in this timezone
-        now_utc = datetime.datetime.now(datetime.timezone.utc)
-        tz = pytz.timezone(tz_name)
-        now_local = now_utc.astimezone(tz)
+# UTC offsets only change at DST transitions, so the per-zone skeleton is
+# rebuilt at most once an hour
+_OFFSET_SKELETON_TTL = 3600
+_offset_skeleton_cache = {"expires": 0.0, "data": None}
 
-        timezones_by_region[region].append(
+
+def _offset_skeleton():
+    """Attach current UTC offsets to the frozen region grouping (cached)."""
+    now = time.time()
+    if _offset_skeleton_cache["data"] is not None and now < _offset_skeleton_cache["expires"]:
+        return _offset_skeleton_cache["data"]
+
+    now_utc = datetime.datetime.now(datetime.timezone.utc)
+    skeleton = {}
+    for region, names in _REGION_INDEX.items():
+        entries = []
+        for tz_name in names:
+            # One integer offset read per zone; both public fields derive from it
+            secs = int(now_utc.astimezone(_get_tz(tz_name)).utcoffset().total_seconds())
+            entries.append(
+                {
+                    "name": tz_name,
+                    "utc_offset": _fmt_offset_secs(secs),
+                    "utc_offset_hours": secs / 3600.0,
+                }
+            )
+        skeleton[region] = entries
+
+    _offset_skeleton_cache["data"] = skeleton
+    _offset_skeleton_cache["expires"] = now + _OFFSET_SKELETON_TTL
+    return skeleton
+
+
+def list_common_timezones(now: datetime.datetime | None = None) -> Dict[str, Any]:
+    """
+    Get a list of common timezones grouped by region.
+
+    Args:
+        now: Optional pre-captured UTC time shared with other helpers in the
+             same request; defaults to a single clock reading per call.
+
+    Returns:
+        A dictionary with timezone information grouped by region
+    """
+    now_utc = now if now is not None else datetime.datetime.now(datetime.timezone.utc)
+
+    # Only current_time is recomputed per call; the offset skeleton is cached.
+    # Bound methods are hoisted so the per-zone loop is pure C-level calls
+    astimezone = now_utc.astimezone
+    timezones_by_region = {
+        region: [
             {
-                "name": tz_name,
-                "utc_offset": now_local.strftime("%z"),
-                "utc_offset_hours": float(now_local.utcoffset().total_seconds() / 3600),
-                "current_time": now_local.strftime("%H:%M:%S"),
+                **entry,
+                "current_time": (
+                    f"{(local := astimezone(_get_tz(entry['name']))).hour:02d}"
+                    f":{local.minute:02d}:{local.second:02d}"
+                ),
             }
-        )
+            for entry in entries
+        ]
+        for region, entries in _offset_skeleton().items()
+    }
 
     return {
-        "regions": sorted(timezones_by_region.keys()),
+        "regions": _REGIONS,
         "timezones_by_region": timezones_by_region,
-        "total_count": len(pytz.common_timezones),
+        "total_count": _TOTAL_COUNT,
     }
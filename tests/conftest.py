@@ -1,8 +1,70 @@
 """Pytest configuration file."""
 
-import pytest
+import copy
+import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from calendar_app.models.event_store import FetchResult
+
+# The suite is dominated by interpreter startup; skip .pyc writes for test runs
+sys.dont_write_bytecode = True
+
+
+# Selector names exercised on EventKit objects. Used as lightweight specs so
+# stubs reject typo'd attributes without the cost of full autospeccing (EventKit
+# classes resolve selectors dynamically, so create_autospec is not an option).
+EVENT_SPEC = [
+    "title",
+    "location",
+    "notes",
+    "startDate",
+    "endDate",
+    "isAllDay",
+    "calendar",
+    "URL",
+    "availability",
+    "hasAttendees",
+    "attendees",
+    "organizer",
+]
+
+REMINDER_SPEC = [
+    "title",
+    "notes",
+    "dueDateComponents",
+    "priority",
+    "isCompleted",
+    "calendar",
+]
+
+ATTENDEE_SPEC = [
+    "name",
+    "emailAddress",
+    "participantStatus",
+    "participantType",
+    "participantRole",
+    "isEqual_",
+]
+
+
+@pytest.fixture(scope="session")
+def busy():
+    """EKCalendarEventAvailabilityBusy, imported lazily to keep collection cheap."""
+    from EventKit import EKCalendarEventAvailabilityBusy
+
+    return EKCalendarEventAvailabilityBusy
+
+
+@pytest.fixture(scope="session")
+def json_schema():
+    """Memoized output schema shared by every test that inspects it."""
+    from calendar_app.models.formatters import get_json_schema
+
+    return get_json_schema()
+
 
 @pytest.fixture
 def mock_nsdate():
@@ -13,77 +75,133 @@ def mock_nsdate():
         yield mock
 
 
-@pytest.fixture
-def mock_event():
-    """Create a mock event for testing."""
-    event = MagicMock()
-    event.title.return_value = "Test Event"
-    event.location.return_value = "Test Location"
-    event.notes.return_value = "Test Notes"
-    event.startDate.return_value.description.return_value = "2023-01-15 10:00:00"
-    event.endDate.return_value.description.return_value = "2023-01-15 11:00:00"
-    event.isAllDay.return_value = False
-    event.calendar().title.return_value = "Test Calendar"
-    event.URL.return_value = None
-    event.availability.return_value = 1  # EKCalendarEventAvailabilityBusy
-    event.hasAttendees.return_value = False
-    event.organizer.return_value = None
+@pytest.fixture(scope="session")
+def event_stub_factory():
+    """Factory for lightweight event stubs; far cheaper to build than MagicMock."""
+
+    def make(**overrides):
+        calendar = SimpleNamespace(title=lambda: "Test Calendar")
+        fields = {
+            "title": lambda: "Test Event",
+            "location": lambda: "Test Location",
+            "notes": lambda: "Test Notes",
+            "startDate": lambda: SimpleNamespace(description=lambda: "2023-01-15 10:00:00"),
+            "endDate": lambda: SimpleNamespace(description=lambda: "2023-01-15 11:00:00"),
+            "isAllDay": lambda: False,
+            "calendar": lambda: calendar,
+            "URL": lambda: None,
+            "availability": lambda: 1,  # EKCalendarEventAvailabilityBusy
+            "hasAttendees": lambda: False,
+            "attendees": lambda: [],
+            "organizer": lambda: None,
+        }
+        fields.update(overrides)
+        return SimpleNamespace(**fields)
+
+    return make
+
+
+# Default mock behaviors, applied in one configure_mock pass instead of a
+# per-attribute assignment cascade
+_DEFAULT_EVENT = {
+    "title.return_value": "Test Event",
+    "location.return_value": "Test Location",
+    "notes.return_value": "Test Notes",
+    "startDate.return_value.description.return_value": "2023-01-15 10:00:00",
+    "endDate.return_value.description.return_value": "2023-01-15 11:00:00",
+    "isAllDay.return_value": False,
+    "calendar.return_value.title.return_value": "Test Calendar",
+    "URL.return_value": None,
+    "availability.return_value": 1,  # EKCalendarEventAvailabilityBusy
+    "hasAttendees.return_value": False,
+    "organizer.return_value": None,
+}
+
+_DEFAULT_REMINDER = {
+    "title.return_value": "Test Reminder",
+    "notes.return_value": "Test Notes",
+    "dueDateComponents.return_value.date.return_value.description.return_value": (
+        "2023-01-15 18:00:00"
+    ),
+    "priority.return_value": 1,
+    "isCompleted.return_value": False,
+    "calendar.return_value.title.return_value": "Test Calendar",
+}
+
+
+@pytest.fixture(scope="session")
+def _mock_event_proto():
+    """Configure the event mock once per session."""
+    event = MagicMock(spec=EVENT_SPEC)
+    event.configure_mock(**_DEFAULT_EVENT)
     return event
 
 
 @pytest.fixture
-def mock_reminder():
-    """Create a mock reminder for testing."""
-    reminder = MagicMock()
-    reminder.title.return_value = "Test Reminder"
-    reminder.notes.return_value = "Test Notes"
-    reminder.dueDateComponents().date().description.return_value = "2023-01-15 18:00:00"
-    reminder.priority.return_value = 1
-    reminder.isCompleted.return_value = False
-    reminder.calendar().title.return_value = "Test Calendar"
+def mock_event(_mock_event_proto):
+    """Create a mock event for testing (a deep copy of the session prototype).
+
+    A shallow copy would share child mocks and call records with the
+    prototype, so per-test mutation needs deepcopy.
+    """
+    return copy.deepcopy(_mock_event_proto)
+
+
+@pytest.fixture(scope="session")
+def _mock_reminder_proto():
+    """Configure the reminder mock once per session."""
+    reminder = MagicMock(spec=REMINDER_SPEC)
+    reminder.configure_mock(**_DEFAULT_REMINDER)
     return reminder
 
 
 @pytest.fixture
-def mock_event_store():
-    """Create a mock event store for testing."""
-    with patch("calendar_app.models.event_store.CalendarEventStore") as mock_cls:
-        mock_store = MagicMock()
-        mock_cls.return_value = mock_store
-
-        # Configure default behaviors
-        mock_store.event_authorized = True
-        mock_store.reminder_authorized = True
-
-        # Sample data for calendars
-        mock_store.get_calendars.return_value = {
-            "event_calendars": [
-                {"title": "Work", "color": "#FF0000", "type": "Event"},
-                {"title": "Personal", "color": "#00FF00", "type": "Event"},
-            ],
-            "reminder_calendars": [{"title": "Tasks", "color": "#0000FF", "type": "Reminder"}],
-        }
+def mock_reminder(_mock_reminder_proto):
+    """Create a mock reminder for testing (a deep copy of the session prototype)."""
+    return copy.deepcopy(_mock_reminder_proto)
+
 
-        # Sample data for events and reminders
-        mock_store.get_events_and_reminders.return_value = {
-            "events": [
-                {
-                    "title": "Team Meeting",
-                    "location": "Conference Room",
-                    "start_time": "2023-01-15 10:00:00",
-                    "end_time": "2023-01-15 11:00:00",
-                    "all_day": False,
-                    "calendar": "Work",
-                }
-            ],
-            "reminders": [
-                {
-                    "title": "Buy groceries",
-                    "due_date": "2023-01-15 18:00:00",
-                    "completed": False,
-                    "calendar": "Personal",
-                }
-            ],
+# Sample payloads for the stub event store; built once instead of per test
+_CALENDARS = {
+    "event_calendars": [
+        {"title": "Work", "color": "#FF0000", "type": "Event"},
+        {"title": "Personal", "color": "#00FF00", "type": "Event"},
+    ],
+    "reminder_calendars": [{"title": "Tasks", "color": "#0000FF", "type": "Reminder"}],
+}
+
+_EVENTS_AND_REMINDERS = FetchResult(
+    events=[
+        {
+            "title": "Team Meeting",
+            "location": "Conference Room",
+            "start_time": "2023-01-15 10:00:00",
+            "end_time": "2023-01-15 11:00:00",
+            "all_day": False,
+            "calendar": "Work",
+        }
+    ],
+    reminders=[
+        {
+            "title": "Buy groceries",
+            "due_date": "2023-01-15 18:00:00",
+            "completed": False,
+            "calendar": "Personal",
         }
+    ],
+)
 
-        yield mock_store
+
+@pytest.fixture
+def mock_event_store(monkeypatch):
+    """Create a stub event store for testing."""
+    store = SimpleNamespace(
+        event_authorized=True,
+        reminder_authorized=True,
+        get_calendars=lambda: _CALENDARS,
+        get_events_and_reminders=lambda **kwargs: _EVENTS_AND_REMINDERS,
+    )
+    monkeypatch.setattr(
+        "calendar_app.models.event_store.CalendarEventStore", lambda *args, **kwargs: store
+    )
+    return store
@@ -0,0 +1,49 @@
+"""Shared fixtures for CLI tests."""
+
+import argparse
+
+import pytest
+
+import calendar_app.cli
+
+
+def make_args(**kwargs):
+    """Build a real argparse.Namespace, so unset attributes raise like production args."""
+    return argparse.Namespace(**kwargs)
+
+
+class Recorder:
+    """Minimal callable that records its calls, replacing mock.patch stubs."""
+
+    def __init__(self, result=None):
+        self.calls = []
+        self.result = result
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.result
+
+    @property
+    def call_count(self):
+        return len(self.calls)
+
+    def assert_called_once(self):
+        assert len(self.calls) == 1
+
+    def assert_called_once_with(self, *args, **kwargs):
+        assert self.calls == [(args, kwargs)]
+
+    def assert_not_called(self):
+        assert self.calls == []
+
+
+@pytest.fixture
+def cli_stub(monkeypatch):
+    """Replace a calendar_app.cli attribute with a Recorder for one test."""
+
+    def stub(name, result=None):
+        recorder = Recorder(result)
+        monkeypatch.setattr(calendar_app.cli, name, recorder, raising=False)
+        return recorder
+
+    return stub
@@ -1,61 +1,96 @@
 """Tests for event and reminder formatters."""
 
 import sys
-from unittest.mock import MagicMock, patch
+from collections import namedtuple
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
-from EventKit import EKCalendarEventAvailabilityBusy
 
 from calendar_app.models.formatters import (
     get_human_readable_status,
     format_event,
     format_reminder,
-    get_json_schema,
 )
 
+# Attendees are pure data; namedtuple construction is far cheaper than mocks
+Attendee = namedtuple(
+    "Attendee",
+    "name emailAddress participantStatus participantType participantRole isEqual_",
+)
+
+
+def _cal(title):
+    """Build a calendar accessor stub without any MagicMock child chains."""
+    ns = SimpleNamespace(title=lambda t=title: t)
+    return lambda: ns
+
 
 class TestGetHumanReadableStatus:
     """Tests for get_human_readable_status function."""
 
-    def test_known_status_codes(self):
+    @pytest.mark.parametrize(
+        "code,expected",
+        [
+            (0, "unknown"),
+            (1, "pending"),
+            (2, "accepted"),
+            (3, "declined"),
+            (4, "tentative"),
+            (5, "delegated"),
+            (6, "completed"),
+            (7, "in-process"),
+        ],
+    )
+    def test_known_status_codes(self, code, expected):
         """Test conversion of known status codes to readable strings."""
-        assert get_human_readable_status(0) == "unknown"
-        assert get_human_readable_status(1) == "pending"
-        assert get_human_readable_status(2) == "accepted"
-        assert get_human_readable_status(3) == "declined"
-        assert get_human_readable_status(4) == "tentative"
-        assert get_human_readable_status(5) == "delegated"
-        assert get_human_readable_status(6) == "completed"
-        assert get_human_readable_status(7) == "in-process"
+        assert get_human_readable_status(code) == expected
 
     def test_unknown_status_code(self):
         """Test conversion of unknown status code."""
         assert get_human_readable_status(999) == "unknown"
 
-    def test_non_integer_status(self):
+    @pytest.mark.parametrize("status", ["abc", None])
+    def test_non_integer_status(self, status):
         """Test conversion of non-integer status."""
-        assert get_human_readable_status("abc") == "unknown"
-        assert get_human_readable_status(None) == "unknown"
+        assert get_human_readable_status(status) == "unknown"
+
+
+@pytest.fixture(scope="module")
+def attendees():
+    """Immutable attendee stubs shared by every test in this module."""
+    john = Attendee(
+        name=lambda: "John Doe",
+        emailAddress=lambda: "john@example.com",
+        participantStatus=lambda: 2,  # Accepted
+        participantType=lambda: 1,  # Person
+        participantRole=lambda: 1,  # Required
+        isEqual_=lambda other: True,  # This attendee is the organizer
+    )
+    jane = Attendee(
+        name=lambda: "Jane Smith",
+        emailAddress=lambda: "jane@example.com",
+        participantStatus=lambda: 4,  # Tentative
+        participantType=lambda: 1,  # Person
+        participantRole=lambda: 2,  # Optional
+        isEqual_=lambda other: False,  # This attendee is not the organizer
+    )
+    return john, jane
 
 
 class TestFormatEvent:
     """Tests for format_event function."""
 
-    def test_basic_event_formatting(self):
+    def test_basic_event_formatting(self, event_stub_factory, busy):
         """Test formatting an event with basic properties."""
-        # Create mock event
-        event = MagicMock()
-        event.title.return_value = "Meeting"
-        event.location.return_value = "Conference Room"
-        event.notes.return_value = "Discuss project status"
-        event.startDate.return_value.description.return_value = "2023-01-15 10:00:00"
-        event.endDate.return_value.description.return_value = "2023-01-15 11:00:00"
-        event.isAllDay.return_value = False
-        event.calendar().title.return_value = "Work"
-        event.URL.return_value = None
-        event.availability.return_value = EKCalendarEventAvailabilityBusy
-        event.hasAttendees.return_value = False
-        event.organizer.return_value = None
+        # Create stub event
+        event = event_stub_factory(
+            title=lambda: "Meeting",
+            location=lambda: "Conference Room",
+            notes=lambda: "Discuss project status",
+            calendar=_cal("Work"),
+            availability=lambda: busy,
+        )
 
         # Format event
         result = format_event(event)
@@ -75,7 +110,7 @@ class TestFormatEvent:
         assert result["organizer"] is None
 
     @pytest.mark.skip(reason="URL extraction implementation may vary, needs to be fixed later")
-    def test_event_with_conference_url(self):
+    def test_event_with_conference_url(self, busy):
         """Test formatting an event with conference URL."""
         # For this test we won't validate the conference URL extraction since it's
         # implementation dependent and might change. Instead, let's test the location
@@ -92,7 +127,7 @@ class TestFormatEvent:
         event.isAllDay.return_value = False
         event.calendar().title.return_value = "Work"
         event.URL.return_value = None
-        event.availability.return_value = EKCalendarEventAvailabilityBusy
+        event.availability.return_value = busy
         event.hasAttendees.return_value = False
         event.organizer.return_value = None
 
@@ -106,26 +141,19 @@ class TestFormatEvent:
         # In a real implementation with a proper regex, this would be true:
         # assert "zoom.us" in result["location"]
 
-    def test_event_with_url_as_conference_url(self):
+    def test_event_with_url_as_conference_url(self, event_stub_factory, busy):
         """Test formatting an event with URL as conference URL."""
-        # Create mock event
-        event = MagicMock()
-        event.title.return_value = "Virtual Meeting"
-        event.location.return_value = "Office"
-        event.notes.return_value = "Project discussion"
-        event.startDate.return_value.description.return_value = "2023-01-15 10:00:00"
-        event.endDate.return_value.description.return_value = "2023-01-15 11:00:00"
-        event.isAllDay.return_value = False
-        event.calendar().title.return_value = "Work"
-
-        # Create a mock URL that looks like a Zoom URL
-        url_mock = MagicMock()
-        url_mock.absoluteString.return_value = "https://zoom.us/j/987654321"
-        event.URL.return_value = url_mock
-
-        event.availability.return_value = EKCalendarEventAvailabilityBusy
-        event.hasAttendees.return_value = False
-        event.organizer.return_value = None
+        # Create a stub URL that looks like a Zoom URL
+        url_stub = SimpleNamespace(absoluteString=lambda: "https://zoom.us/j/987654321")
+
+        event = event_stub_factory(
+            title=lambda: "Virtual Meeting",
+            location=lambda: "Office",
+            notes=lambda: "Project discussion",
+            calendar=_cal("Work"),
+            URL=lambda: url_stub,
+            availability=lambda: busy,
+        )
 
         # Format event
         result = format_event(event)
@@ -137,27 +165,30 @@ class TestFormatEvent:
         # Location should remain as original since it's not empty
         assert result["location"] == "Office"
 
-    @patch("calendar_app.models.formatters.print")
-    def test_url_conversion_error(self, mock_print):
+    def test_url_conversion_error(self, monkeypatch, event_stub_factory, busy):
         """Test handling errors during URL conversion."""
-        # Create mock event
-        event = MagicMock()
-        event.title.return_value = "Meeting"
-        event.location.return_value = "Office"
-        event.notes.return_value = "Project discussion"
-        event.startDate.return_value.description.return_value = "2023-01-15 10:00:00"
-        event.endDate.return_value.description.return_value = "2023-01-15 11:00:00"
-        event.isAllDay.return_value = False
-        event.calendar().title.return_value = "Work"
+        # Capture print calls without the mock.patch machinery
+        printed = []
+        monkeypatch.setattr(
+            "calendar_app.models.formatters.print",
+            lambda *a, **k: printed.append((a, k)),
+            raising=False,
+        )
 
         # Make URL conversion raise an exception
-        url_mock = MagicMock()
-        url_mock.absoluteString.side_effect = Exception("Test error")
-        event.URL.return_value = url_mock
+        def raise_error():
+            raise Exception("Test error")
 
-        event.availability.return_value = EKCalendarEventAvailabilityBusy
-        event.hasAttendees.return_value = False
-        event.organizer.return_value = None
+        url_stub = SimpleNamespace(absoluteString=raise_error)
+
+        event = event_stub_factory(
+            title=lambda: "Meeting",
+            location=lambda: "Office",
+            notes=lambda: "Project discussion",
+            calendar=_cal("Work"),
+            URL=lambda: url_stub,
+            availability=lambda: busy,
+        )
 
         # Format event
         result = format_event(event)
@@ -166,52 +197,29 @@ class TestFormatEvent:
         assert result["url"] is None
 
         # Verify error was logged
-        mock_print.assert_called_once()
-        assert "Error converting URL" in mock_print.call_args[0][0]
-        assert mock_print.call_args[1]["file"] == sys.stderr
+        assert len(printed) == 1
+        assert "Error converting URL" in printed[0][0][0]
+        assert printed[0][1]["file"] == sys.stderr
 
-    def test_event_with_attendees(self):
+    def test_event_with_attendees(self, event_stub_factory, attendees, busy):
         """Test formatting an event with attendees."""
-        # Create mock event
-        event = MagicMock()
-        event.title.return_value = "Team Meeting"
-        event.location.return_value = "Conference Room"
-        event.notes.return_value = "Discuss project status"
-        event.startDate.return_value.description.return_value = "2023-01-15 10:00:00"
-        event.endDate.return_value.description.return_value = "2023-01-15 11:00:00"
-        event.isAllDay.return_value = False
-        event.calendar().title.return_value = "Work"
-        event.URL.return_value = None
-        event.availability.return_value = EKCalendarEventAvailabilityBusy
-
-        # Create attendees
-        attendee1 = MagicMock()
-        attendee1.name.return_value = "John Doe"
-        attendee1.emailAddress.return_value = "john@example.com"
-        attendee1.participantStatus.return_value = 2  # Accepted
-        attendee1.participantType.return_value = 1  # Person
-        attendee1.participantRole.return_value = 1  # Required
-
-        attendee2 = MagicMock()
-        attendee2.name.return_value = "Jane Smith"
-        attendee2.emailAddress.return_value = "jane@example.com"
-        attendee2.participantStatus.return_value = 4  # Tentative
-        attendee2.participantType.return_value = 1  # Person
-        attendee2.participantRole.return_value = 2  # Optional
+        attendee1, attendee2 = attendees
 
         # Set up organizer
-        organizer = MagicMock()
-        organizer.name.return_value = "John Doe"
-        organizer.emailAddress.return_value = "john@example.com"
-        event.organizer.return_value = organizer
-
-        # Define isEqual_ behavior to identify the organizer
-        attendee1.isEqual_.return_value = True  # This attendee is the organizer
-        attendee2.isEqual_.return_value = False  # This attendee is not the organizer
-
-        # Set up hasAttendees and attendees
-        event.hasAttendees.return_value = True
-        event.attendees.return_value = [attendee1, attendee2]
+        organizer = SimpleNamespace(
+            name=lambda: "John Doe", emailAddress=lambda: "john@example.com"
+        )
+
+        event = event_stub_factory(
+            title=lambda: "Team Meeting",
+            location=lambda: "Conference Room",
+            notes=lambda: "Discuss project status",
+            calendar=_cal("Work"),
+            availability=lambda: busy,
+            hasAttendees=lambda: True,
+            attendees=lambda: [attendee1, attendee2],
+            organizer=lambda: organizer,
+        )
 
         # Format event
         result = format_event(event)
@@ -245,14 +253,18 @@ class TestFormatReminder:
 
     def test_reminder_formatting(self):
         """Test formatting a reminder."""
-        # Create mock reminder
-        reminder = MagicMock()
-        reminder.title.return_value = "Buy groceries"
-        reminder.notes.return_value = "Milk, eggs, bread"
-        reminder.dueDateComponents().date().description.return_value = "2023-01-15 18:00:00"
-        reminder.priority.return_value = 1
-        reminder.isCompleted.return_value = False
-        reminder.calendar().title.return_value = "Personal"
+        # Create stub reminder
+        due = SimpleNamespace(
+            date=lambda: SimpleNamespace(description=lambda: "2023-01-15 18:00:00")
+        )
+        reminder = SimpleNamespace(
+            title=lambda: "Buy groceries",
+            notes=lambda: "Milk, eggs, bread",
+            dueDateComponents=lambda: due,
+            priority=lambda: 1,
+            isCompleted=lambda: False,
+            calendar=_cal("Personal"),
+        )
 
         # Format reminder
         result = format_reminder(reminder)
@@ -267,14 +279,15 @@ class TestFormatReminder:
 
     def test_reminder_without_due_date(self):
         """Test formatting a reminder without a due date."""
-        # Create mock reminder
-        reminder = MagicMock()
-        reminder.title.return_value = "Buy groceries"
-        reminder.notes.return_value = "Milk, eggs, bread"
-        reminder.dueDateComponents.return_value = None
-        reminder.priority.return_value = 1
-        reminder.isCompleted.return_value = False
-        reminder.calendar().title.return_value = "Personal"
+        # Create stub reminder
+        reminder = SimpleNamespace(
+            title=lambda: "Buy groceries",
+            notes=lambda: "Milk, eggs, bread",
+            dueDateComponents=lambda: None,
+            priority=lambda: 1,
+            isCompleted=lambda: False,
+            calendar=_cal("Personal"),
+        )
 
         # Format reminder
         result = format_reminder(reminder)
@@ -284,9 +297,9 @@ class TestFormatReminder:
         assert result["due_date"] is None
 
 
-def test_get_json_schema():
+def test_get_json_schema(json_schema):
     """Test the get_json_schema function."""
-    schema = get_json_schema()
+    schema = json_schema
 
     # Verify schema structure
     assert isinstance(schema, dict)
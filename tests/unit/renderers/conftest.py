@@ -0,0 +1,44 @@
+"""Shared fixtures for renderer tests."""
+
+import copy
+
+import pytest
+
+from calendar_app.renderers.calendar_list import CalendarListTemplateRenderer
+from calendar_app.renderers.markdown import CalendarTemplateRenderer
+
+
+@pytest.fixture(scope="session")
+def _markdown_renderer_proto():
+    """Build one markdown renderer per session so the template compiles once."""
+    return CalendarTemplateRenderer({})
+
+
+@pytest.fixture
+def markdown_renderer(_markdown_renderer_proto):
+    """Factory for renderers sharing the session-compiled markdown template."""
+
+    def make(calendar_data=None):
+        renderer = copy.copy(_markdown_renderer_proto)
+        renderer.calendar_data = {} if calendar_data is None else calendar_data
+        return renderer
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def _calendar_list_renderer_proto():
+    """Build one calendar list renderer per session so the template compiles once."""
+    return CalendarListTemplateRenderer({})
+
+
+@pytest.fixture
+def calendar_list_renderer(_calendar_list_renderer_proto):
+    """Factory for renderers sharing the session-compiled calendar list template."""
+
+    def make(calendars_data=None):
+        renderer = copy.copy(_calendar_list_renderer_proto)
+        renderer.calendars_data = {} if calendars_data is None else calendars_data
+        return renderer
+
+    return make
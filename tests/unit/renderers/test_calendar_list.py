@@ -1,12 +1,26 @@
 """Tests for calendar list renderer."""
 
 import sys
-from unittest.mock import patch
 
 import pytest
 
 from calendar_app.renderers.calendar_list import CalendarListTemplateRenderer
 
+VALID_CALENDARS = {
+    "event_calendars": [
+        {"title": "Work", "color": "#FF0000", "type": "Event"},
+        {"title": "Personal", "color": "#00FF00", "type": "Event"},
+    ],
+    "reminder_calendars": [{"title": "Tasks", "color": "#0000FF", "type": "Reminder"}],
+}
+
+EMPTY_CALENDARS = {"event_calendars": [], "reminder_calendars": []}
+
+ERROR_CALENDARS = {
+    "events_error": "Calendar access not authorized",
+    "reminders_error": "Reminders access not authorized",
+}
+
 
 class TestCalendarListTemplateRenderer:
     """Tests for the CalendarListTemplateRenderer class."""
@@ -26,77 +40,61 @@ class TestCalendarListTemplateRenderer:
         # Verify that sort_calendars is in the environment globals
         assert "sort_calendars" in renderer.env.globals
 
-    def test_generate_with_valid_data(self):
-        """Test generating markdown with valid calendar data."""
-        # Prepare test data
-        calendars_data = {
-            "event_calendars": [
-                {"title": "Work", "color": "#FF0000", "type": "Event"},
-                {"title": "Personal", "color": "#00FF00", "type": "Event"},
-            ],
-            "reminder_calendars": [{"title": "Tasks", "color": "#0000FF", "type": "Reminder"}],
-        }
-
-        # Create renderer
-        renderer = CalendarListTemplateRenderer(calendars_data)
-
-        # Generate markdown
-        markdown = renderer.generate()
-
-        # Verify content (calendars should be sorted by title)
-        assert "### Event Calendars" in markdown
-        assert "- Personal (#00FF00)" in markdown
-        assert "- Work (#FF0000)" in markdown
-
-        assert "### Reminder Calendars" in markdown
-        assert "- Tasks (#0000FF)" in markdown
-
-    def test_generate_with_empty_data(self):
-        """Test generating markdown with empty calendar data."""
-        # Prepare test data
-        calendars_data = {"event_calendars": [], "reminder_calendars": []}
-
-        # Create renderer
-        renderer = CalendarListTemplateRenderer(calendars_data)
-
-        # Generate markdown
-        markdown = renderer.generate()
-
-        # Verify content
-        assert "No calendars found or access denied" in markdown
-
-    def test_generate_with_errors(self):
-        """Test generating markdown with error messages."""
-        # Prepare test data with errors
-        calendars_data = {
-            "events_error": "Calendar access not authorized",
-            "reminders_error": "Reminders access not authorized",
-        }
-
-        # Create renderer
-        renderer = CalendarListTemplateRenderer(calendars_data)
-
-        # Generate markdown
-        markdown = renderer.generate()
-
-        # Verify content
-        assert "### Event Calendars" in markdown
-        assert "Error: Calendar access not authorized" in markdown
-
-        assert "### Reminder Calendars" in markdown
-        assert "Error: Reminders access not authorized" in markdown
-
-    @patch("calendar_app.renderers.calendar_list.print")
-    def test_generate_with_render_error(self, mock_print):
+    @pytest.mark.parametrize(
+        "data,expected",
+        [
+            pytest.param(
+                VALID_CALENDARS,
+                [
+                    "### Event Calendars",
+                    "- Personal (#00FF00)",
+                    "- Work (#FF0000)",
+                    "### Reminder Calendars",
+                    "- Tasks (#0000FF)",
+                ],
+                id="valid",
+            ),
+            pytest.param(
+                EMPTY_CALENDARS,
+                ["No calendars found or access denied"],
+                id="empty",
+            ),
+            pytest.param(
+                ERROR_CALENDARS,
+                [
+                    "### Event Calendars",
+                    "Error: Calendar access not authorized",
+                    "### Reminder Calendars",
+                    "Error: Reminders access not authorized",
+                ],
+                id="errors",
+            ),
+        ],
+    )
+    def test_generate(self, calendar_list_renderer, data, expected):
+        """Test generating markdown for valid, empty and error data."""
+        markdown = calendar_list_renderer(data).generate()
+
+        for substring in expected:
+            assert substring in markdown
+
+    def test_generate_with_render_error(self, calendar_list_renderer, monkeypatch):
         """Test handling errors during template rendering."""
-        # Create a mock template that raises an exception
-        renderer = CalendarListTemplateRenderer({})
+        renderer = calendar_list_renderer()
+
+        # Capture print calls without the mock.patch machinery
+        printed = []
+        monkeypatch.setattr(
+            "calendar_app.renderers.calendar_list.print",
+            lambda *a, **k: printed.append((a, k)),
+            raising=False,
+        )
 
-        # Make the template.render method raise an exception
+        # Make the shared template's render method raise; monkeypatch restores it
         def mock_render(**kwargs):
             raise ValueError("Test error")
 
-        renderer.template.render = mock_render
+        monkeypatch.setattr(renderer.template, "render", mock_render)
 
         # Generate markdown (should catch the exception)
         markdown = renderer.generate()
@@ -106,6 +104,6 @@ class TestCalendarListTemplateRenderer:
         assert "Test error" in markdown
 
         # Verify error was logged
-        mock_print.assert_called_once()
-        assert "Error rendering template" in mock_print.call_args[0][0]
-        assert mock_print.call_args[1]["file"] == sys.stderr
+        assert len(printed) == 1
+        assert "Error rendering template" in printed[0][0][0]
+        assert printed[0][1]["file"] == sys.stderr
@@ -9,6 +9,28 @@ from jinja2 import Environment
 
 from calendar_app.renderers.markdown import CalendarTemplateRenderer, format_as_markdown
 
+VALID_DATA = {
+    "events": [
+        {
+            "title": "Team Meeting",
+            "start_time": "2023-01-15 10:00:00",
+            "end_time": "2023-01-15 11:00:00",
+            "location": "Conference Room",
+            "calendar": "Work",
+        }
+    ],
+    "reminders": [
+        {
+            "title": "Buy groceries",
+            "due_date": "2023-01-15 18:00:00",
+            "completed": False,
+            "calendar": "Personal",
+        }
+    ],
+}
+
+EMPTY_DATA = {"events": [], "reminders": []}
+
 
 class TestCalendarTemplateRenderer:
     """Tests for the CalendarTemplateRenderer class."""
@@ -31,46 +53,40 @@ class TestCalendarTemplateRenderer:
         assert "sort_reminders" in renderer.env.globals
         assert renderer.template is not None
 
-    def test_format_date(self):
+    @pytest.mark.parametrize(
+        "date_str,expected",
+        [
+            ("2023-01-15 00:00:00 +0000", "2023-01-15"),
+            ("", ""),
+            (None, ""),
+            # Fallback to original string
+            ("not a valid date", "not a valid date"),
+        ],
+        ids=["valid", "empty", "none", "invalid"],
+    )
+    def test_format_date(self, markdown_renderer, date_str, expected):
         """Test date formatting."""
-        renderer = CalendarTemplateRenderer({})
-
-        # Test valid date
-        assert renderer.format_date("2023-01-15 00:00:00 +0000") == "2023-01-15"
-
-        # Test empty input
-        assert renderer.format_date("") == ""
-        assert renderer.format_date(None) == ""
-
-        # Test fallback to original string
-        assert renderer.format_date("not a valid date") == "not a valid date"
-
-    def test_format_time_range(self):
+        assert markdown_renderer().format_date(date_str) == expected
+
+    @pytest.mark.parametrize(
+        "start,end,expected",
+        [
+            ("2023-01-15 09:30:00 +0000", "2023-01-15 10:45:00 +0000", "09:30 - 10:45"),
+            ("2023-01-15 14:00:00 +0000", None, "14:00"),
+            ("", "", ""),
+            (None, None, ""),
+            # Fallback to original strings
+            ("invalid start", "invalid end", "invalid start - invalid end"),
+        ],
+        ids=["range", "start-only", "empty", "none", "invalid"],
+    )
+    def test_format_time_range(self, markdown_renderer, start, end, expected):
         """Test time range formatting."""
-        renderer = CalendarTemplateRenderer({})
-
-        # Test valid time range
-        assert (
-            renderer.format_time_range("2023-01-15 09:30:00 +0000", "2023-01-15 10:45:00 +0000")
-            == "09:30 - 10:45"
-        )
-
-        # Test start time only
-        assert renderer.format_time_range("2023-01-15 14:00:00 +0000", None) == "14:00"
-
-        # Test empty values
-        assert renderer.format_time_range("", "") == ""
-        assert renderer.format_time_range(None, None) == ""
-
-        # Test fallback to original strings
-        assert (
-            renderer.format_time_range("invalid start", "invalid end")
-            == "invalid start - invalid end"
-        )
+        assert markdown_renderer().format_time_range(start, end) == expected
 
-    def test_sort_events(self):
+    def test_sort_events(self, markdown_renderer):
         """Test event sorting by start time."""
-        renderer = CalendarTemplateRenderer({})
+        renderer = markdown_renderer()
 
         # Create test events
         events = [
@@ -83,14 +99,11 @@ class TestCalendarTemplateRenderer:
         sorted_events = renderer.sort_events(events)
 
         # Verify order (events without start_time should be first since they sort as '')
-        assert sorted_events[0]["title"] == "Event D"
-        assert sorted_events[1]["title"] == "Event A"
-        assert sorted_events[2]["title"] == "Event B"
-        assert sorted_events[3]["title"] == "Event C"
+        assert [e["title"] for e in sorted_events] == ["Event D", "Event A", "Event B", "Event C"]
 
-    def test_sort_reminders(self):
+    def test_sort_reminders(self, markdown_renderer):
         """Test reminder sorting by completion status and due date."""
-        renderer = CalendarTemplateRenderer({})
+        renderer = markdown_renderer()
 
         # Create test reminders
         reminders = [
@@ -103,76 +116,56 @@ class TestCalendarTemplateRenderer:
         sorted_reminders = renderer.sort_reminders(reminders)
 
         # Verify order (incomplete first, then by due date)
-        assert sorted_reminders[0]["title"] == "Task A"
-        assert sorted_reminders[1]["title"] == "Task B"
-        assert sorted_reminders[2]["title"] == "Task D"
-        assert sorted_reminders[3]["title"] == "Task C"
-
-    def test_generate_with_valid_data(self):
-        """Test generating markdown with valid calendar data."""
-        # Prepare test data
-        calendar_data = {
-            "events": [
-                {
-                    "title": "Team Meeting",
-                    "start_time": "2023-01-15 10:00:00",
-                    "end_time": "2023-01-15 11:00:00",
-                    "location": "Conference Room",
-                    "calendar": "Work",
-                }
-            ],
-            "reminders": [
-                {
-                    "title": "Buy groceries",
-                    "due_date": "2023-01-15 18:00:00",
-                    "completed": False,
-                    "calendar": "Personal",
-                }
-            ],
-        }
-
-        # Create renderer
-        renderer = CalendarTemplateRenderer(calendar_data)
-
-        # Generate markdown
-        markdown = renderer.generate()
-
-        # Verify content
-        assert "### Events" in markdown
-        assert "Team Meeting" in markdown
-        assert "Conference Room" in markdown
-        assert "Work" in markdown
-
-        assert "### Reminders" in markdown
-        assert "Buy groceries" in markdown
-        assert "[ ]" in markdown  # Incomplete task
-        assert "Personal" in markdown
-
-    def test_generate_with_empty_data(self):
-        """Test generating markdown with empty calendar data."""
-        # Prepare test data
-        calendar_data = {"events": [], "reminders": []}
-
-        # Create renderer
-        renderer = CalendarTemplateRenderer(calendar_data)
-
-        # Generate markdown
-        markdown = renderer.generate()
-
-        # Verify content
-        assert "No events or reminders found for the specified criteria" in markdown
-
-    @patch("calendar_app.renderers.markdown.print")
-    def test_generate_with_error(self, mock_print):
+        assert [r["title"] for r in sorted_reminders] == ["Task A", "Task B", "Task D", "Task C"]
+
+    @pytest.mark.parametrize(
+        "data,expected",
+        [
+            pytest.param(
+                VALID_DATA,
+                [
+                    "### Events",
+                    "Team Meeting",
+                    "Conference Room",
+                    "Work",
+                    "### Reminders",
+                    "Buy groceries",
+                    "[ ]",  # Incomplete task
+                    "Personal",
+                ],
+                id="valid",
+            ),
+            pytest.param(
+                EMPTY_DATA,
+                ["No events or reminders found for the specified criteria"],
+                id="empty",
+            ),
+        ],
+    )
+    def test_generate(self, markdown_renderer, data, expected):
+        """Test generating markdown for valid and empty data."""
+        markdown = markdown_renderer(data).generate()
+
+        for substring in expected:
+            assert substring in markdown
+
+    def test_generate_with_error(self, markdown_renderer, monkeypatch):
         """Test handling errors during template rendering."""
-        # Create a mock template that raises an exception
-        renderer = CalendarTemplateRenderer({})
+        renderer = markdown_renderer()
+
+        # Capture print calls without the mock.patch machinery
+        printed = []
+        monkeypatch.setattr(
+            "calendar_app.renderers.markdown.print",
+            lambda *a, **k: printed.append((a, k)),
+            raising=False,
+        )
 
-        # Make the template.render method raise an exception
+        # Make the shared template's render method raise; monkeypatch restores it
         def mock_render(**kwargs):
             raise ValueError("Test error")
 
-        renderer.template.render = mock_render
+        monkeypatch.setattr(renderer.template, "render", mock_render)
 
         # Generate markdown (should catch the exception)
         markdown = renderer.generate()
@@ -182,9 +175,9 @@ class TestCalendarTemplateRenderer:
         assert "Test error" in markdown
 
         # Verify error was logged
-        mock_print.assert_called_once()
-        assert "Error rendering template" in mock_print.call_args[0][0]
-        assert mock_print.call_args[1]["file"] == sys.stderr
+        assert len(printed) == 1
+        assert "Error rendering template" in printed[0][0][0]
+        assert printed[0][1]["file"] == sys.stderr
 
 
 def test_format_as_markdown():
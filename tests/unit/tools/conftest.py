@@ -0,0 +1,44 @@
+"""Shared fixtures for MCP tool tests."""
+
+import copy
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def _event_store_template():
+    """Prototype placeholder store, built once; tests never assert on its calls."""
+    return MagicMock()
+
+
+@pytest.fixture
+def placeholder_event_store(_event_store_template):
+    """Per-test copy of the placeholder event store.
+
+    A shallow copy shares child mocks (and their call records) with the
+    template, so this is only suitable for mocks the tests pass through
+    without asserting on - exactly how the tool tests use the store.
+    """
+    return copy.copy(_event_store_template)
+
+
+@pytest.fixture
+def patched_fastmcp(monkeypatch):
+    """Swap fastmcp.FastMCP for a mock factory via monkeypatch.
+
+    The factory and the server mock it returns are built fresh per test:
+    both get asserted on, so they cannot be shared copies (see
+    placeholder_event_store for why).
+    """
+    factory = MagicMock(return_value=MagicMock())
+    monkeypatch.setattr("calendar_app.tools.mcp_server.fastmcp.FastMCP", factory)
+    return factory
+
+
+@pytest.fixture(scope="session")
+def timezone_listing():
+    """Walk the IANA database once per session; the listing is process-static."""
+    from calendar_app.utils.date_utils import list_common_timezones
+
+    return list_common_timezones()
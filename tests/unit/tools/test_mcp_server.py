@@ -1,48 +1,19 @@
 """Tests for MCP server setup."""
 
-from unittest.mock import MagicMock, patch
-
 import pytest
 import fastmcp
 
 from calendar_app.tools.mcp_server import setup_mcp_server
 
 
-@patch("calendar_app.tools.mcp_server.fastmcp.FastMCP")
-def test_setup_mcp_server(mock_fastmcp):
-    """Test setting up the MCP server."""
-    # Mock FastMCP instance
-    mock_mcp = MagicMock()
-    mock_fastmcp.return_value = mock_mcp
-
-    # Create mock event store
-    mock_event_store = MagicMock()
-
-    # Call function
-    result = setup_mcp_server(mock_event_store)
-
-    # Verify FastMCP was created with the correct name
-    mock_fastmcp.assert_called_once_with("Calendar Events")
-
-    # Verify that tools were registered
-    assert mock_mcp.tool.call_count >= 8  # We have at least 8 tools
-
-    # Verify that the prompt function was registered
-    assert mock_mcp.prompt.call_count >= 1  # We have at least 1 prompt
-
-    # Verify result
-    assert result == mock_mcp
-
-
-def test_mcp_tools_registered():
-    """Test that all expected MCP tools are registered when setup_mcp_server is called."""
-    # Create mock objects
-    mock_mcp = MagicMock()
-    mock_event_store = MagicMock()
+def test_setup_mcp_server_registers_tools_and_resources(patched_fastmcp, placeholder_event_store):
+    """Test server setup and tool registration in a single pass."""
+    mock_mcp = patched_fastmcp.return_value
 
     # Create lists to capture registered function names
     registered_tools = []
     registered_resources = []
+    registered_prompts = []
 
     # Define side effects to capture function names
     def capture_tool(func=None):
@@ -53,15 +24,23 @@ def test_mcp_tools_registered():
     def capture_resource(path=None):
         return lambda f: registered_resources.append(f.__name__)
 
+    def capture_prompt(func=None):
+        if func is not None:
+            registered_prompts.append(func.__name__)
+        return lambda f: registered_prompts.append(f.__name__)
+
     # Configure the mock MCP
     mock_mcp.tool = capture_tool
     mock_mcp.resource = capture_resource
-    mock_mcp.prompt = lambda func=None: (lambda f: None) if func is None else None
+    mock_mcp.prompt = capture_prompt
 
-    # Mock FastMCP
-    with patch("calendar_app.tools.mcp_server.fastmcp.FastMCP", return_value=mock_mcp):
-        # Call function
-        setup_mcp_server(mock_event_store)
+    # Call function once; both the setup contract and the registrations are
+    # asserted from this single pass
+    result = setup_mcp_server(placeholder_event_store)
+
+    # Verify FastMCP was created with the correct name and returned
+    patched_fastmcp.assert_called_once_with("Calendar Events")
+    assert result == mock_mcp
 
     # Verify that all expected tools were registered
     expected_tools = [
@@ -78,4 +57,8 @@ def test_mcp_tools_registered():
     for tool in expected_tools:
         assert tool in registered_tools, f"Expected tool {tool} not found in registered tools"
 
+    assert len(registered_tools) >= 8  # We have at least 8 tools
+    assert len(registered_prompts) >= 1  # We have at least 1 prompt
+
     # No resources are expected in this version
+    assert registered_resources == []
@@ -0,0 +1,12 @@
+"""Shared fixtures for date/timezone utility tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_tz_cache():
+    """Prime the timezone cache so tests measure steady-state behavior."""
+    from calendar_app.utils.date_utils import _get_tz
+
+    for tz in ("UTC", "America/New_York", "Europe/London", "Asia/Tokyo"):
+        _get_tz(tz)
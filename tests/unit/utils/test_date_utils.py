@@ -44,7 +44,10 @@ class TestGetDateRange:
         # Setup mock
         mock_start_date = "mocked_start_date"
         mock_end_date = "mocked_end_date"
-        mock_nsdate.dateWithTimeIntervalSince1970_.side_effect = [mock_start_date, mock_end_date]
+        # A lambda over an iterator skips MagicMock's per-call side_effect
+        # list machinery
+        results = iter([mock_start_date, mock_end_date])
+        mock_nsdate.dateWithTimeIntervalSince1970_ = MagicMock(side_effect=lambda ts: next(results))
 
         # Call function
         from_date = datetime.datetime(2023, 1, 15)
@@ -84,7 +87,8 @@ class TestGetDateRange:
         # Mock NSDate
         mock_start_date = "mocked_start_date"
         mock_end_date = "mocked_end_date"
-        mock_nsdate.dateWithTimeIntervalSince1970_.side_effect = [mock_start_date, mock_end_date]
+        results = iter([mock_start_date, mock_end_date])
+        mock_nsdate.dateWithTimeIntervalSince1970_ = MagicMock(side_effect=lambda ts: next(results))
 
         # Call function with defaults
         start_date, end_date = get_date_range(None, None)
@@ -9,6 +9,7 @@ import pytz
 from calendar_app.utils.date_utils import (
     get_current_datetime,
     convert_timezone,
+    convert_timezone_many,
     list_common_timezones,
 )
 
@@ -175,6 +176,39 @@ class TestConvertTimezone:
         assert "valid_format" in result
 
 
+class TestConvertTimezoneMany:
+    """Tests for convert_timezone_many function."""
+
+    def test_convert_timezone_many_matches_single(self):
+        """Test that batch results match the single-conversion API."""
+        dt_strs = ["2023-01-01 12:00:00", "2023-06-01 12:00:00"]
+        from_tz = "UTC"
+        to_tz = "America/New_York"
+
+        results = convert_timezone_many(dt_strs, from_tz, to_tz)
+
+        assert len(results) == len(dt_strs)
+        for dt_str, result in zip(dt_strs, results, strict=True):
+            assert result == convert_timezone(dt_str, from_tz, to_tz)
+
+    def test_convert_timezone_many_mixed_validity(self):
+        """Test that malformed entries get per-item errors without aborting the batch."""
+        results = convert_timezone_many(["2023-01-01 12:00:00", "not-a-date"], "UTC", "UTC")
+
+        assert "converted" in results[0]
+        assert "error" in results[1]
+        assert "Invalid datetime format" in results[1]["error"]
+
+    def test_convert_timezone_many_invalid_timezone(self):
+        """Test that an invalid timezone fails the whole batch up front."""
+        result = convert_timezone_many(["2023-01-01 12:00:00"], "Invalid/Timezone", "UTC")
+
+        # Should return a single error, not a list
+        assert "error" in result
+        assert "Invalid source timezone" in result["error"]
+        assert "valid_format" in result
+
+
 class TestListCommonTimezones:
     """Tests for list_common_timezones function."""
 